@@ -80,6 +80,9 @@ class ConnectConfig:
 # TODO: config versions migrate
 _CONFIG_VERSION = 2
 
+# matches the connection pool size of databricks.sdk.core.ApiClient when nothing is configured
+_DEFAULT_CONNECTIONS_PER_POOL = 20
+
 T = TypeVar("T")
 
 
@@ -194,6 +197,14 @@ class WorkspaceConfig(_Config["WorkspaceConfig"]):
         raw = cls._migrate_from_v1(raw)
         return cls(**raw)
 
+    def to_databricks_config(self) -> Config:
+        # the SDK sizes each pool to max_connection_pools, unless max_connections_per_pool is set
+        pool_size = self.connect.max_connection_pools or _DEFAULT_CONNECTIONS_PER_POOL
+        if self.connect.max_connections_per_pool is None and (self.num_threads or 0) > pool_size:
+            # the SDK blocks on a pool checkout, so keep a keep-alive connection for every worker thread
+            return dataclasses.replace(self.connect, max_connections_per_pool=self.num_threads).to_databricks_config()
+        return super().to_databricks_config()
+
     def to_workspace_client(self) -> WorkspaceClient:
         return WorkspaceClient(config=self.to_databricks_config())
 
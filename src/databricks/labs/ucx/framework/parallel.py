@@ -1,4 +1,3 @@
-import concurrent
 import datetime as dt
 import functools
 import logging
@@ -81,7 +80,9 @@ class Threads(Generic[Result]):
                 future = pool.submit(self._wrap_result(task, self._name))
                 future.add_done_callback(self._progress_report)
                 futures.append(future)
-            return concurrent.futures.as_completed(futures)
+        # the pool has waited for every task on exit, so walking futures in submission
+        # order keeps collected results in the relative order of their tasks
+        return futures
 
     def _progress_report(self, _):
         total_cnt = len(self._tasks)
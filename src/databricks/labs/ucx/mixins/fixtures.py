@@ -8,6 +8,7 @@ import string
 import subprocess
 import sys
 from collections.abc import Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import BinaryIO, Optional
 
@@ -28,7 +29,7 @@ from databricks.labs.ucx.framework.crawlers import StatementExecutionBackend
 logger = logging.getLogger(__name__)
 
 
-def factory(name, create, remove):
+def factory(name, create, remove, *, parallel_remove: bool = False):
     cleanup = []
 
     def inner(**kwargs):
@@ -37,9 +38,7 @@ def factory(name, create, remove):
         cleanup.append(x)
         return x
 
-    yield inner
-    logger.debug(f"clearing {len(cleanup)} {name} fixtures")
-    for x in cleanup:
+    def safe_remove(x):
         try:
             logger.debug(f"removing {name} fixture: {x}")
             remove(x)
@@ -47,6 +46,18 @@ def factory(name, create, remove):
             # TODO: fix on the databricks-labs-pytester level
             logger.debug(f"ignoring error while {name} {x} teardown: {e}")
 
+    yield inner
+    logger.debug(f"clearing {len(cleanup)} {name} fixtures")
+    if not parallel_remove:
+        # removal may restore earlier state (e.g. permissions) or depend on nesting (e.g. directories),
+        # so undo fixtures in the reverse order of their creation
+        for x in reversed(cleanup):
+            safe_remove(x)
+        return
+    # opted in by factories whose objects are independent of each other
+    with ThreadPoolExecutor() as pool:
+        list(pool.map(safe_remove, cleanup))
+
 
 @pytest.fixture
 def fresh_wheel_file(tmp_path) -> Path:
@@ -410,6 +421,7 @@ def make_user(ws, make_random):
         "workspace user",
         lambda **kwargs: ws.users.create(user_name=f"sdk-{make_random(4)}@example.com".lower(), **kwargs),
         lambda item: ws.users.delete(item.id),
+        parallel_remove=True,
     )
 
 
@@ -441,7 +453,7 @@ def _make_group(name, cfg, interface, make_random):
             logger.info(f"Workspace group {group.display_name}: {cfg.host}#setting/accounts/groups/{group.id}")
         return group
 
-    yield from factory(name, create, lambda item: interface.delete(item.id))
+    yield from factory(name, create, lambda item: interface.delete(item.id), parallel_remove=True)
 
 
 @pytest.fixture
@@ -469,7 +481,9 @@ def make_cluster_policy(ws, make_random):
         )
         return cluster_policy
 
-    yield from factory("cluster policy", create, lambda item: ws.cluster_policies.delete(item.policy_id))
+    yield from factory(
+        "cluster policy", create, lambda item: ws.cluster_policies.delete(item.policy_id), parallel_remove=True
+    )
 
 
 @pytest.fixture
@@ -506,7 +520,9 @@ def make_cluster(ws, make_random):
             **kwargs,
         )
 
-    yield from factory("cluster", create, lambda item: ws.clusters.permanent_delete(item.cluster_id))
+    yield from factory(
+        "cluster", create, lambda item: ws.clusters.permanent_delete(item.cluster_id), parallel_remove=True
+    )
 
 
 @pytest.fixture
@@ -541,7 +557,9 @@ def make_instance_pool(ws, make_random):
             node_type_id = ws.clusters.select_node_type(local_disk=True)
         return ws.instance_pools.create(instance_pool_name, node_type_id, **kwargs)
 
-    yield from factory("instance pool", create, lambda item: ws.instance_pools.delete(item.instance_pool_id))
+    yield from factory(
+        "instance pool", create, lambda item: ws.instance_pools.delete(item.instance_pool_id), parallel_remove=True
+    )
 
 
 @pytest.fixture
@@ -587,7 +605,7 @@ def make_job(ws, make_random, make_notebook):
         logger.info(f"Job: {ws.config.host}#job/{job.job_id}")
         return job
 
-    yield from factory("job", create, lambda item: ws.jobs.delete(item.job_id))
+    yield from factory("job", create, lambda item: ws.jobs.delete(item.job_id), parallel_remove=True)
 
 
 @pytest.fixture
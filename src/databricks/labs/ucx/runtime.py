@@ -229,7 +229,12 @@ def rename_workspace_local_groups(cfg: WorkspaceConfig):
     sql_backend = RuntimeBackend()
     ws = WorkspaceClient(config=cfg.to_databricks_config())
     group_manager = GroupManager(
-        sql_backend, ws, cfg.inventory_database, cfg.include_group_names, cfg.renamed_group_prefix
+        sql_backend,
+        ws,
+        cfg.inventory_database,
+        cfg.include_group_names,
+        cfg.renamed_group_prefix,
+        num_threads=cfg.num_threads,
     )
     group_manager.rename_groups()
 
@@ -240,7 +245,12 @@ def reflect_account_groups_on_workspace(cfg: WorkspaceConfig):
     sql_backend = RuntimeBackend()
     ws = WorkspaceClient(config=cfg.to_databricks_config())
     group_manager = GroupManager(
-        sql_backend, ws, cfg.inventory_database, cfg.include_group_names, cfg.renamed_group_prefix
+        sql_backend,
+        ws,
+        cfg.inventory_database,
+        cfg.include_group_names,
+        cfg.renamed_group_prefix,
+        num_threads=cfg.num_threads,
     )
     group_manager.reflect_account_groups_on_workspace()
 
@@ -282,7 +292,14 @@ def delete_backup_groups(cfg: WorkspaceConfig):
     successfully for all the groups involved."""
     backend = RuntimeBackend()
     ws = WorkspaceClient(config=cfg.to_databricks_config())
-    group_manager = GroupManager(backend, ws, cfg.inventory_database, cfg.include_group_names, cfg.renamed_group_prefix)
+    group_manager = GroupManager(
+        backend,
+        ws,
+        cfg.inventory_database,
+        cfg.include_group_names,
+        cfg.renamed_group_prefix,
+        num_threads=cfg.num_threads,
+    )
     group_manager.delete_original_workspace_groups()
 
 
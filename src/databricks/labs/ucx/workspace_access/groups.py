@@ -6,6 +6,7 @@ from dataclasses import dataclass
 
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.core import DatabricksError
+from databricks.sdk.errors import NotFound
 from databricks.sdk.retries import retried
 from databricks.sdk.service import iam
 
@@ -15,6 +16,9 @@ from databricks.labs.ucx.mixins.hardening import rate_limited
 
 logger = logging.getLogger(__name__)
 
+# the assignment payload is the same for every reflected group, so it is serialized once
+_USER_PERMISSION_ASSIGNMENT = json.dumps({"permissions": ["USER"]})
+
 
 @dataclass
 class MigratedGroup:
@@ -48,6 +52,9 @@ class MigrationState:
         else:
             return name in self._name_to_group
 
+    def is_id_in_scope(self, group_id: str) -> bool:
+        return group_id in self._id_to_group
+
     def get_target_id(self, group_id: str) -> str | None:
         group = self._id_to_group.get(group_id)
         if group:
@@ -60,7 +67,7 @@ class MigrationState:
 
 
 class GroupManager(CrawlerBase):
-    _SYSTEM_GROUPS: typing.ClassVar[list[str]] = ["users", "admins", "account users"]
+    _SYSTEM_GROUPS: typing.ClassVar[frozenset[str]] = frozenset({"users", "admins", "account users"})
 
     def __init__(
         self,
@@ -69,11 +76,16 @@ class GroupManager(CrawlerBase):
         inventory_database: str,
         include_group_names: list[str] | None = None,
         renamed_group_prefix: str = "ucx-renamed-",
+        *,
+        num_threads: int | None = None,
     ):
         super().__init__(sql_backend, "hive_metastore", inventory_database, "groups", MigratedGroup)
         self._ws = ws
         self._include_group_names = include_group_names
         self._renamed_group_prefix = renamed_group_prefix
+        self._num_threads = num_threads
+        # SCIM listings keyed by (level, attributes), dropped on every group mutation
+        self._groups_cache: dict[tuple[str, str], list[iam.Group]] = {}
 
     def snapshot(self) -> list[MigratedGroup]:
         return self._snapshot(self._fetcher, self._crawler)
@@ -82,10 +94,12 @@ class GroupManager(CrawlerBase):
         return len(self.snapshot()) > 0
 
     def rename_groups(self):
+        # listings may have changed since an earlier call, e.g. by another workflow or the UI
+        self._groups_cache.clear()
         tasks = []
+        groups_to_migrate = self.get_migration_state().groups
         account_groups_in_workspace = self._account_groups_in_workspace()
         workspace_groups_in_workspace = self._workspace_groups_in_workspace()
-        groups_to_migrate = self.get_migration_state().groups
 
         for mg in groups_to_migrate:
             if mg.name_in_account in account_groups_in_workspace:
@@ -96,7 +110,7 @@ class GroupManager(CrawlerBase):
                 continue
             logger.info(f"Renaming: {mg.name_in_workspace} -> {mg.temporary_name}")
             tasks.append(functools.partial(self._rename_group, mg.id_in_workspace, mg.temporary_name))
-        _, errors = Threads.gather("rename groups in the workspace", tasks)
+        _, errors = Threads.gather("rename groups in the workspace", tasks, num_threads=self._num_threads)
         if len(errors) > 0:
             msg = f"During rename of workspace groups got {len(errors)} errors. See debug logs"
             raise RuntimeWarning(msg)
@@ -104,13 +118,16 @@ class GroupManager(CrawlerBase):
     def _rename_group(self, group_id: str, new_group_name: str):
         ops = [iam.Patch(iam.PatchOp.REPLACE, "displayName", new_group_name)]
         self._ws.groups.patch(group_id, operations=ops)
+        self._groups_cache.clear()
         return True
 
     def reflect_account_groups_on_workspace(self):
+        # listings may have changed since an earlier call, e.g. by another workflow or the UI
+        self._groups_cache.clear()
         tasks = []
+        groups_to_migrate = self.get_migration_state().groups
         account_groups_in_account = self._account_groups_in_account()
         account_groups_in_workspace = self._account_groups_in_workspace()
-        groups_to_migrate = self.get_migration_state().groups
 
         for mg in groups_to_migrate:
             if mg.name_in_account in account_groups_in_workspace:
@@ -121,7 +138,7 @@ class GroupManager(CrawlerBase):
                 continue
             group_id = account_groups_in_account[mg.name_in_account]
             tasks.append(functools.partial(self._reflect_account_group_to_workspace, group_id))
-        _, errors = Threads.gather("reflect account groups on this workspace", tasks)
+        _, errors = Threads.gather("reflect account groups on this workspace", tasks, num_threads=self._num_threads)
         if len(errors) > 0:
             msg = f"During account-to-workspace reflection got {len(errors)} errors. See debug logs"
             raise RuntimeWarning(msg)
@@ -130,10 +147,13 @@ class GroupManager(CrawlerBase):
         return MigrationState(self.snapshot())
 
     def delete_original_workspace_groups(self):
+        # listings may have changed since an earlier call, e.g. by another workflow or the UI
+        self._groups_cache.clear()
         tasks = []
+        groups_to_migrate = self.snapshot()
         workspace_groups_in_workspace = self._workspace_groups_in_workspace()
         account_groups_in_workspace = self._account_groups_in_workspace()
-        for mg in self.snapshot():
+        for mg in groups_to_migrate:
             if mg.temporary_name not in workspace_groups_in_workspace:
                 logger.info(f"Skipping {mg.name_in_workspace}: no longer in workspace")
                 continue
@@ -141,7 +161,7 @@ class GroupManager(CrawlerBase):
                 logger.info(f"Skipping {mg.name_in_account}: not reflected in workspace")
                 continue
             tasks.append(functools.partial(self._delete_workspace_group, mg.id_in_workspace, mg.temporary_name))
-        _, errors = Threads.gather("removing original workspace groups", tasks)
+        _, errors = Threads.gather("removing original workspace groups", tasks, num_threads=self._num_threads)
         if len(errors) > 0:
             msg = f"During account-to-workspace reflection got {len(errors)} errors. See debug logs"
             raise RuntimeWarning(msg)
@@ -192,7 +212,7 @@ class GroupManager(CrawlerBase):
     def _list_workspace_groups(self, resource_type: str, scim_attributes: str) -> list[iam.Group]:
         results = []
         logger.info(f"Listing workspace groups (resource_type={resource_type}) with {scim_attributes}...")
-        for g in self._ws.groups.list(attributes=scim_attributes):
+        for g in self._cached_groups("workspace", scim_attributes, self._fetch_workspace_groups):
             if g.display_name in self._SYSTEM_GROUPS:
                 continue
             if g.meta.resource_type != resource_type:
@@ -205,7 +225,39 @@ class GroupManager(CrawlerBase):
         # TODO: we should avoid using this method, as it's not documented
         # get account-level groups even if they're not (yet) assigned to a workspace
         logger.info(f"Listing account groups with {scim_attributes}...")
-        account_groups = [
+        account_groups = sorted(
+            (
+                g
+                for g in self._cached_groups("account", scim_attributes, self._fetch_account_groups)
+                if g.display_name not in self._SYSTEM_GROUPS
+            ),
+            key=lambda _: _.display_name,
+        )
+        logger.info(f"Found {len(account_groups)} account groups")
+        return account_groups
+
+    def _cached_groups(
+        self, level: str, scim_attributes: str, fetch: typing.Callable[[str], list[iam.Group]]
+    ) -> list[iam.Group]:
+        # a listing fetched with more attributes, e.g. by the crawler, answers narrower requests as well
+        wanted = set(scim_attributes.split(","))
+        for (cached_level, cached_attributes), groups in list(self._groups_cache.items()):
+            if cached_level == level and wanted.issubset(cached_attributes.split(",")):
+                return groups
+        groups = fetch(scim_attributes)
+        self._groups_cache[(level, scim_attributes)] = groups
+        return groups
+
+    def _fetch_workspace_groups(self, scim_attributes: str) -> list[iam.Group]:
+        return list(self._ws.groups.list(attributes=scim_attributes, filter=self._display_name_filter()))
+
+    @classmethod
+    def _display_name_filter(cls) -> str:
+        # sorted, so that the filter string doesn't depend on the hash seed
+        return " and ".join(f'displayName ne "{name}"' for name in sorted(cls._SYSTEM_GROUPS))
+
+    def _fetch_account_groups(self, scim_attributes: str) -> list[iam.Group]:
+        return [
             iam.Group.from_dict(r)
             for r in self._ws.api_client.do(
                 "get",
@@ -213,9 +265,6 @@ class GroupManager(CrawlerBase):
                 query={"attributes": scim_attributes},
             ).get("Resources", [])
         ]
-        account_groups = [g for g in account_groups if g.display_name not in self._SYSTEM_GROUPS]
-        logger.info(f"Found {len(account_groups)} account groups")
-        return sorted(account_groups, key=lambda _: _.display_name)
 
     @retried(on=[DatabricksError])
     @rate_limited(max_requests=35, burst_period_seconds=60)
@@ -223,19 +272,24 @@ class GroupManager(CrawlerBase):
         try:
             logger.info(f"Deleting the workspace-level group {display_name} with id {group_id}")
             self._ws.groups.delete(id=group_id)
+            self._groups_cache.clear()
             logger.info(f"Workspace-level group {display_name} with id {group_id} was deleted")
             return True
         except DatabricksError as err:
-            if "not found" in str(err):
-                return True
-            raise
+            # older API versions report a missing group only in the message
+            if not isinstance(err, NotFound) and "not found" not in str(err):
+                raise
+            self._groups_cache.clear()
+            logger.warning(f"Workspace-level group {display_name} with id {group_id} was already deleted")
+            return True
 
     @retried(on=[DatabricksError])
     @rate_limited(max_requests=10)
     def _reflect_account_group_to_workspace(self, account_group_id: str):
         # TODO: add OpenAPI spec for it
         path = f"/api/2.0/preview/permissionassignments/principals/{account_group_id}"
-        self._ws.api_client.do("PUT", path, data=json.dumps({"permissions": ["USER"]}))
+        self._ws.api_client.do("PUT", path, data=_USER_PERMISSION_ASSIGNMENT)
+        self._groups_cache.clear()
         return True
 
     def _get_valid_group_names_to_migrate(
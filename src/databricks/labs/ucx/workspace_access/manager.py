@@ -146,7 +146,7 @@ class PermissionManager(CrawlerBase):
 
     def load_all(self) -> list[Permissions]:
         logger.info(f"Loading inventory table {self._full_name}")
-        if list(self._fetch(f"SELECT COUNT(*) as cnt FROM {self._full_name}"))[0][0] == 0:  # noqa: RUF015
+        if next(iter(self._fetch(f"SELECT COUNT(*) as cnt FROM {self._full_name}")))[0] == 0:
             msg = (
                 f"table {self._full_name} is empty for fetching permission info. "
                 f"Please ensure assessment job is run successfully and permissions populated"
@@ -36,6 +36,7 @@ class GroupMigrationToolkit:
             config.inventory_database,
             config.include_group_names,
             config.renamed_group_prefix,
+            num_threads=config.num_threads,
         )
         # TODO: remove VerificationManager in scope of https://github.com/databrickslabs/ucx/issues/36,
         # where we probably should add verify() abstract method to every Applier
@@ -53,7 +53,7 @@ class RedashPermissionsSupport(AclSupport):
         mentioned_groups = [
             acl.group_name for acl in sql.GetResponse.from_dict(json.loads(item.raw)).access_control_list
         ]
-        return any(g in mentioned_groups for g in [info.name_in_workspace for info in migration_state.groups])
+        return any(migration_state.is_in_scope(g) for g in mentioned_groups)
 
     def get_crawler_tasks(self):
         for listing in self._listings:
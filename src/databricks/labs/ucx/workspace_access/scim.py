@@ -24,7 +24,7 @@ class ScimSupport(AclSupport):
 
     @staticmethod
     def _is_item_relevant(item: Permissions, migration_state: MigrationState) -> bool:
-        return any(g.id_in_workspace == item.object_id for g in migration_state.groups)
+        return migration_state.is_id_in_scope(item.object_id)
 
     def get_crawler_tasks(self):
         for g in self._get_groups():
@@ -45,6 +45,9 @@ class ScimSupport(AclSupport):
         if not self._is_item_relevant(item, migration_state):
             return None
         value = [iam.ComplexValue.from_dict(e) for e in json.loads(item.raw)]
+        if not value:
+            # the crawler never stores empty values, but legacy or hand-edited inventory rows may hold []
+            return None
         target_group_id = migration_state.get_target_id(item.object_id)
         return partial(self._applier_task, group_id=target_group_id, value=value, property_name=item.object_type)
 
@@ -67,9 +70,10 @@ class ScimSupport(AclSupport):
             if property_name == "entitlements" and group.entitlements:
                 if all(elem in group.entitlements for elem in value):
                     return True
+            found = getattr(group, property_name) or []
             msg = f"""Couldn't apply appropriate role for group {group_id}
                             acl to be applied={[e.as_dict() for e in value]}
-                            acl found in the object={group.as_dict()}
+                            acl found in the object={[e.as_dict() for e in found]}
                             """
             raise ValueError(msg)
         return False
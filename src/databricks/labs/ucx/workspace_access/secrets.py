@@ -66,7 +66,7 @@ class SecretScopesSupport(AclSupport):
     def _is_item_relevant(item: Permissions, migration_state: MigrationState) -> bool:
         acls = [workspace.AclItem.from_dict(acl) for acl in json.loads(item.raw)]
         mentioned_groups = [acl.principal for acl in acls]
-        return any(g in mentioned_groups for g in [info.name_in_workspace for info in migration_state.groups])
+        return any(migration_state.is_in_scope(g) for g in mentioned_groups)
 
     def secret_scope_permission(self, scope_name: str, group_name: str) -> workspace.AclPermission | None:
         for acl in self._ws.secrets.list_acls(scope=scope_name):
@@ -74,6 +74,9 @@ class SecretScopesSupport(AclSupport):
                 return acl.permission
         return None
 
+    def secret_scope_permissions(self, scope_name: str) -> dict[str, workspace.AclPermission]:
+        return {acl.principal: acl.permission for acl in self._ws.secrets.list_acls(scope=scope_name)}
+
     def _inflight_check(self, scope_name: str, group_name: str, expected_permission: workspace.AclPermission):
         # in-flight check for the applied permissions
         # the api might be inconsistent, therefore we need to check that the permissions were applied
@@ -1,11 +1,16 @@
 from typing import Literal
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.iam import Group
 
 from databricks.labs.ucx.workspace_access.groups import MigrationState
 from databricks.labs.ucx.workspace_access.secrets import SecretScopesSupport
 
 
+class VerificationError(AssertionError):
+    """Raised explicitly rather than via assert, so that verification still runs under python -O"""
+
+
 class VerificationManager:
     def __init__(self, ws: WorkspaceClient, secrets_support: SecretScopesSupport):
         self._ws = ws
@@ -39,33 +44,47 @@ class VerificationManager:
                 [_ for _ in op.access_control_list if _.group_name == getattr(info, base_attr)],
                 key=lambda p: p.group_name,
             )
-            assert len(dst_permissions) == len(
-                src_permissions
-            ), f"Target permissions were not applied correctly for {object_type}/{object_id}"
-            assert [t.all_permissions for t in dst_permissions] == [
+            if len(dst_permissions) != len(src_permissions) or [t.all_permissions for t in dst_permissions] != [
                 s.all_permissions for s in src_permissions
-            ], f"Target permissions were not applied correctly for {object_type}/{object_id}"
+            ]:
+                msg = f"Target permissions were not applied correctly for {object_type}/{object_id}"
+                raise VerificationError(msg)
 
     def verify_applied_scope_acls(
         self, scope_name: str, migration_state: MigrationState, target: Literal["backup", "account"]
     ):
         base_attr = "name_in_workspace" if target == "backup" else "temporary_name"
         target = "temporary_name" if target == "backup" else "name_in_account"
+        permissions = self._secrets_support.secret_scope_permissions(scope_name)
         for mi in migration_state.groups:
-            src_name = getattr(mi, base_attr)
-            dst_name = getattr(mi, target)
-            src_permission = self._secrets_support.secret_scope_permission(scope_name, src_name)
-            dst_permission = self._secrets_support.secret_scope_permission(scope_name, dst_name)
-            assert src_permission == dst_permission, "Scope ACLs were not applied correctly"
+            src_permission = permissions.get(getattr(mi, base_attr))
+            dst_permission = permissions.get(getattr(mi, target))
+            if src_permission != dst_permission:
+                msg = "Scope ACLs were not applied correctly"
+                raise VerificationError(msg)
 
     def verify_roles_and_entitlements(self, migration_state: MigrationState, target: Literal["backup", "account"]):
         target = "external_id" if target == "backup" else "id_in_workspace"
+        groups_by_id = self._groups_by_id()
         for el in migration_state.groups:
             comparison_base = getattr(el, "id_in_workspace" if target == "backup" else "id_in_workspace")
             comparison_target = getattr(el, target)
 
-            base_group_info = self._ws.groups.get(comparison_base)
-            target_group_info = self._ws.groups.get(comparison_target)
+            base_group_info = groups_by_id.get(comparison_base)
+            target_group_info = groups_by_id.get(comparison_target)
+            if base_group_info is None:
+                msg = f"Group {comparison_base} not found in the workspace"
+                raise VerificationError(msg)
+            if target_group_info is None:
+                msg = f"Group {comparison_target} not found in the workspace"
+                raise VerificationError(msg)
+
+            if base_group_info.roles != target_group_info.roles:
+                msg = f"Roles were not applied correctly for group {comparison_target}"
+                raise VerificationError(msg)
+            if base_group_info.entitlements != target_group_info.entitlements:
+                msg = f"Entitlements were not applied correctly for group {comparison_target}"
+                raise VerificationError(msg)
 
-            assert base_group_info.roles == target_group_info.roles
-            assert base_group_info.entitlements == target_group_info.entitlements
+    def _groups_by_id(self) -> dict[str, Group]:
+        return {g.id: g for g in self._ws.groups.list(attributes="id,roles,entitlements")}
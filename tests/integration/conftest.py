@@ -2,6 +2,7 @@ import collections
 import functools
 import logging
 import random
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from functools import partial
 
@@ -99,8 +100,12 @@ def make_ucx_group(make_random, make_group, make_acc_group, user_pool):
     def inner():
         display_name = f"ucx_{make_random(4)}"
         members = [_.id for _ in random.choices(user_pool, k=random.randint(1, 40))]
-        ws_group = make_group(display_name=display_name, members=members, entitlements=["allow-cluster-create"])
-        acc_group = make_acc_group(display_name=display_name, members=members)
-        return ws_group, acc_group
+        # workspace and account groups are independent, so create them concurrently
+        with ThreadPoolExecutor(2) as pool:
+            ws_group = pool.submit(
+                make_group, display_name=display_name, members=members, entitlements=["allow-cluster-create"]
+            )
+            acc_group = pool.submit(make_acc_group, display_name=display_name, members=members)
+        return ws_group.result(), acc_group.result()
 
     return inner
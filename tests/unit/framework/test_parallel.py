@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from databricks.sdk.core import DatabricksError
 
@@ -117,3 +118,20 @@ def test_all_works(caplog):
     assert [True, True, True, True] == results
     assert 0 == len(errors)
     assert ["Finished 'testing' tasks: 100% results available (4/4)"] == _predictable_messages(caplog)
+
+
+def test_gather_keeps_order_of_tasks():
+    second_done = threading.Event()
+
+    def first():
+        second_done.wait(timeout=5)
+        return 1
+
+    def second():
+        second_done.set()
+        return 2
+
+    results, errors = Threads.gather("testing", [first, second])
+
+    assert [1, 2] == results
+    assert [] == errors
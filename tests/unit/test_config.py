@@ -5,7 +5,7 @@ from pathlib import Path
 
 import yaml
 
-from databricks.labs.ucx.config import WorkspaceConfig
+from databricks.labs.ucx.config import ConnectConfig, WorkspaceConfig
 
 
 def test_initialization():
@@ -55,3 +55,28 @@ def test_reader(tmp_path: Path):
 
         loaded = WorkspaceConfig.from_file(config_file)
         assert loaded == config
+
+
+def test_connection_pool_fits_num_threads():
+    connect = ConnectConfig(host="https://x", token="x")
+    config = WorkspaceConfig(inventory_database="abc", num_threads=32, connect=connect)
+    assert config.to_databricks_config().max_connections_per_pool == 32
+    assert config.connect.max_connections_per_pool is None
+
+
+def test_connection_pool_keeps_explicit_size():
+    connect = ConnectConfig(host="https://x", token="x", max_connections_per_pool=5)
+    config = WorkspaceConfig(inventory_database="abc", num_threads=32, connect=connect)
+    assert config.to_databricks_config().max_connections_per_pool == 5
+
+
+def test_connection_pool_keeps_sdk_default_for_few_threads():
+    connect = ConnectConfig(host="https://x", token="x")
+    config = WorkspaceConfig(inventory_database="abc", num_threads=10, connect=connect)
+    assert config.to_databricks_config().max_connections_per_pool is None
+
+
+def test_connection_pool_keeps_larger_configured_pools():
+    connect = ConnectConfig(host="https://x", token="x", max_connection_pools=64)
+    config = WorkspaceConfig(inventory_database="abc", num_threads=32, connect=connect)
+    assert config.to_databricks_config().max_connections_per_pool is None
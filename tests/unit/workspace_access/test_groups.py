@@ -2,11 +2,15 @@ from unittest.mock import MagicMock
 
 import pytest
 from _pytest.outcomes import fail
-from databricks.sdk.errors import DatabricksError
+from databricks.sdk.errors import DatabricksError, NotFound
 from databricks.sdk.service import iam
 from databricks.sdk.service.iam import ComplexValue, Group, ResourceMeta
 
-from databricks.labs.ucx.workspace_access.groups import GroupManager, MigratedGroup
+from databricks.labs.ucx.workspace_access.groups import (
+    GroupManager,
+    MigratedGroup,
+    MigrationState,
+)
 from tests.unit.framework.mocks import MockBackend
 
 
@@ -431,3 +435,86 @@ def test_delete_original_workspace_groups_should_fail_if_delete_does_not_work():
 
     with pytest.raises(RuntimeWarning):
         gm.delete_original_workspace_groups()
+
+
+def test_rename_groups_should_list_workspace_groups_once():
+    backend = MockBackend(rows={"SELECT": [("1", "de", "de", "test-group-de", "", "", "", "")]})
+    wsclient = MagicMock()
+    group1 = Group(id="1", display_name="de", meta=ResourceMeta(resource_type="WorkspaceGroup"))
+    wsclient.groups.list.return_value = [group1]
+
+    GroupManager(backend, wsclient, inventory_database="inv", renamed_group_prefix="test-group-").rename_groups()
+    wsclient.groups.list.assert_called_once_with(
+        attributes="id,displayName,meta",
+        filter='displayName ne "account users" and displayName ne "admins" and displayName ne "users"',
+    )
+
+
+def test_group_listing_cache_should_be_dropped_after_rename():
+    backend = MockBackend(rows={"SELECT": [("1", "de", "de", "test-group-de", "", "", "", "")]})
+    wsclient = MagicMock()
+    group1 = Group(id="1", display_name="de", meta=ResourceMeta(resource_type="WorkspaceGroup"))
+    wsclient.groups.list.return_value = [group1]
+
+    gm = GroupManager(backend, wsclient, inventory_database="inv", renamed_group_prefix="test-group-")
+    gm.rename_groups()
+    gm.delete_original_workspace_groups()
+    assert wsclient.groups.list.call_count == 2
+
+
+def test_migration_state_should_index_groups_by_workspace_id():
+    state = MigrationState([MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11")])
+    assert state.is_id_in_scope("1")
+    assert not state.is_id_in_scope("11")
+
+
+def test_delete_original_workspace_groups_should_not_fail_on_not_found():
+    account_id = "11"
+    ws_id = "1"
+    backend = MockBackend(rows={"SELECT": [(ws_id, "de", "de", "test-group-de", account_id, "", "", "")]})
+    wsclient = MagicMock()
+
+    temp_group = Group(id=ws_id, display_name="test-group-de", meta=ResourceMeta(resource_type="WorkspaceGroup"))
+    reflected_group = Group(id=account_id, display_name="de", meta=ResourceMeta(resource_type="Group"))
+    wsclient.groups.list.return_value = [temp_group, reflected_group]
+
+    wsclient.groups.delete.side_effect = NotFound("Group with id 1 is gone")
+    gm = GroupManager(backend, wsclient, inventory_database="inv")
+    gm.delete_original_workspace_groups()
+    wsclient.groups.delete.assert_called_once_with(id=ws_id)
+
+    # the vanished group must not linger in a cached listing
+    assert not gm._groups_cache
+    gm.delete_original_workspace_groups()
+    assert wsclient.groups.list.call_count == 2
+
+
+def test_rename_groups_should_reuse_listing_of_crawler():
+    backend = MockBackend()
+    wsclient = MagicMock()
+    group1 = Group(id="1", display_name="de", meta=ResourceMeta(resource_type="WorkspaceGroup"))
+    wsclient.groups.list.return_value = [group1]
+    account_group1 = Group(id="11", display_name="de")
+    wsclient.api_client.do.return_value = {
+        "Resources": [g.as_dict() for g in [account_group1]],
+    }
+
+    GroupManager(backend, wsclient, inventory_database="inv", renamed_group_prefix="test-group-").rename_groups()
+    assert wsclient.groups.list.call_count == 1
+    assert wsclient.groups.list.call_args.kwargs["attributes"] == "id,displayName,meta,members,roles,entitlements"
+
+
+def test_reflect_account_groups_on_workspace_should_not_reuse_listing_of_earlier_call():
+    backend = MockBackend(rows={"SELECT": [("1", "de", "de", "test-group-de", "", "", "", "")]})
+    wsclient = MagicMock()
+    group1 = Group(id="1", display_name="de", meta=ResourceMeta(resource_type="Group"))
+    wsclient.groups.list.return_value = [group1]
+    account_group1 = Group(id="11", display_name="de")
+    wsclient.api_client.do.return_value = {
+        "Resources": [g.as_dict() for g in [account_group1]],
+    }
+
+    gm = GroupManager(backend, wsclient, inventory_database="inv")
+    gm.reflect_account_groups_on_workspace()
+    gm.reflect_account_groups_on_workspace()
+    assert wsclient.groups.list.call_count == 2
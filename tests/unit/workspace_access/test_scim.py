@@ -196,3 +196,18 @@ def test_get_apply_task_should_ignore_groups_not_in_migration_state():
         external_id="12",
     )
     assert sup.get_apply_task(item, MigrationState([mggrp])) is None
+
+
+def test_get_apply_task_should_ignore_empty_values():
+    ws = MagicMock()
+    sup = ScimSupport(ws=ws, verify_timeout=timedelta(seconds=1))
+
+    item = Permissions(object_id="1", object_type="roles", raw="[]")
+    mggrp = MigratedGroup(
+        id_in_workspace="1",
+        name_in_workspace="de",
+        name_in_account="de",
+        temporary_name="ucx-temp-de",
+        external_id="12",
+    )
+    assert sup.get_apply_task(item, MigrationState([mggrp])) is None
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+import pytest
+from databricks.sdk.errors import NotFound
+from databricks.sdk.service.iam import ComplexValue, Group
+from databricks.sdk.service.workspace import AclItem, AclPermission
+
+from databricks.labs.ucx.workspace_access.groups import MigratedGroup, MigrationState
+from databricks.labs.ucx.workspace_access.secrets import SecretScopesSupport
+from databricks.labs.ucx.workspace_access.verification import (
+    VerificationError,
+    VerificationManager,
+)
+
+
+def test_verify_roles_and_entitlements_should_list_groups_once():
+    ws = MagicMock()
+    ws.groups.list.return_value = [
+        Group(id="1", entitlements=[ComplexValue(value="allow-cluster-create")]),
+        Group(id="11", entitlements=[ComplexValue(value="allow-cluster-create")]),
+        Group(id="2", roles=[ComplexValue(value="role1")]),
+        Group(id="12", roles=[ComplexValue(value="role1")]),
+    ]
+    migration_state = MigrationState(
+        [
+            MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11"),
+            MigratedGroup("2", "ds", "ds", "ucx-renamed-ds", external_id="12"),
+        ]
+    )
+
+    VerificationManager(ws, MagicMock()).verify_roles_and_entitlements(migration_state, "backup")
+
+    ws.groups.list.assert_called_once_with(attributes="id,roles,entitlements")
+    ws.groups.get.assert_not_called()
+
+
+def test_verify_roles_and_entitlements_should_fail_on_mismatch():
+    ws = MagicMock()
+    ws.groups.list.return_value = [
+        Group(id="1", entitlements=[ComplexValue(value="allow-cluster-create")]),
+        Group(id="11"),
+    ]
+    migration_state = MigrationState([MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11")])
+
+    with pytest.raises(VerificationError):
+        VerificationManager(ws, MagicMock()).verify_roles_and_entitlements(migration_state, "backup")
+
+
+def test_verify_applied_scope_acls_should_list_scope_acls_once():
+    ws = MagicMock()
+    ws.secrets.list_acls.return_value = [
+        AclItem(principal="de", permission=AclPermission.READ),
+        AclItem(principal="ucx-renamed-de", permission=AclPermission.READ),
+        AclItem(principal="ds", permission=AclPermission.MANAGE),
+        AclItem(principal="ucx-renamed-ds", permission=AclPermission.MANAGE),
+    ]
+    migration_state = MigrationState(
+        [
+            MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11"),
+            MigratedGroup("2", "ds", "ds", "ucx-renamed-ds", external_id="12"),
+        ]
+    )
+
+    VerificationManager(ws, SecretScopesSupport(ws)).verify_applied_scope_acls("scope", migration_state, "backup")
+
+    ws.secrets.list_acls.assert_called_once_with(scope="scope")
+
+
+def test_verify_applied_scope_acls_should_fail_on_mismatch():
+    ws = MagicMock()
+    ws.secrets.list_acls.return_value = [
+        AclItem(principal="de", permission=AclPermission.READ),
+        AclItem(principal="ucx-renamed-de", permission=AclPermission.MANAGE),
+    ]
+    migration_state = MigrationState([MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11")])
+
+    with pytest.raises(VerificationError):
+        VerificationManager(ws, SecretScopesSupport(ws)).verify_applied_scope_acls("scope", migration_state, "backup")
+
+
+def test_verify_applied_scope_acls_should_propagate_sdk_errors():
+    ws = MagicMock()
+    ws.secrets.list_acls.side_effect = NotFound("scope does not exist")
+    migration_state = MigrationState([MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11")])
+
+    with pytest.raises(NotFound):
+        VerificationManager(ws, SecretScopesSupport(ws)).verify_applied_scope_acls("scope", migration_state, "backup")
+
+
+def test_verify_roles_and_entitlements_should_fail_on_missing_group():
+    ws = MagicMock()
+    ws.groups.list.return_value = [Group(id="1")]
+    migration_state = MigrationState([MigratedGroup("1", "de", "de", "ucx-renamed-de", external_id="11")])
+
+    with pytest.raises(VerificationError) as e:
+        VerificationManager(ws, MagicMock()).verify_roles_and_entitlements(migration_state, "backup")
+    assert e.value.args[0] == "Group 11 not found in the workspace"